@@ -16,6 +16,10 @@ class Graph():
         attached to this edge (as a label).
     nodes : set-like, optional
         A collection of (distinct) hashable objects.
+    compaction_threshold : float, optional
+        Removed edges are marked as tombstones rather than copied out of the graph.
+        Once the fraction of tombstoned edges exceeds :code:`compaction_threshold`,
+        the edge table is compacted. Defaults to 0.25.
         
     Example
     --------
@@ -32,16 +36,23 @@ class Graph():
     .. image:: graph1.png
     
     """
-    def __init__(self,edges = None, nodes = None):
+    def __init__(self,edges = None, nodes = None, compaction_threshold = 0.25):
         self._nodes = set()
         self._edges = pd.DataFrame(columns = ['src_node','dst_node','edge_obj'])
+        # Maps (src_node,dst_node) to the row labels of the live parallel edges.
+        # Row labels always coincide with row positions in self._edges.
+        self._edge_index = dict()
+        self._tombstones = set()
+        self.compaction_threshold = compaction_threshold
         if edges is not None:
             self.add_edges(edges)
         if nodes is not None:
             self.add_nodes(nodes)
     
     def from_df(self,edges):
-        self._edges = edges
+        self._edges = edges.reset_index(drop = True)
+        self._tombstones = set()
+        self._rebuild_index()
         self._nodes = {node for node in edges.src_node}|{node for node in edges.dst_node}
         return self
         
@@ -55,7 +66,7 @@ class Graph():
         """
         self._nodes.update(nodes)
         
-    def add_edges(self,edges):
+    def add_edges(self,edges,upsert = False):
         """Adds edges to the graph. Any new source and destination nodes are also added.
         
         Parameters
@@ -66,14 +77,120 @@ class Graph():
             signifying a directed edge whose source is :code:`src_node` and whose 
             destination is :code:`dst_node`. The object :code:`edge_obj` will be 
             attached to this edge (as a label).
+        upsert : bool, optional
+            If :code:`True`, any existing (parallel) edges from :code:`src_node` to
+            :code:`dst_node` are replaced by the new edge. If the same pair appears
+            several times in :code:`edges`, only the last triple is kept.
             
         """
+        data = [[src,dst,edge_obj] for src,dst,edge_obj in edges]
+        if upsert:
+            latest = dict()
+            for src,dst,edge_obj in data:
+                latest[(src,dst)] = edge_obj
+            self.remove_edges(latest.keys())
+            data = [[src,dst,edge_obj] for (src,dst),edge_obj in latest.items()]
+        start = len(self._edges)
         new_edges = pd.DataFrame(columns = ['src_node','dst_node','edge_obj'],
-                                 data = [[src,dst,edge_obj] for src,dst,edge_obj in edges])
-        self._edges = self._edges.append(new_edges)
+                                 data = data)
+        self._edges = self._edges.append(new_edges,ignore_index = True)
+        for i,(src,dst,_) in enumerate(data,start):
+            self._edge_index.setdefault((src,dst),[]).append(i)
         self.add_nodes({node for node in new_edges.src_node}|
                        {node for node in new_edges.dst_node})
     
+    def has_edge(self,src_node,dst_node):
+        """Returns :code:`True` if there is an edge from :code:`src_node` to
+        :code:`dst_node`. This is a constant time lookup.
+        
+        Parameters
+        ----------
+        src_node
+            The source node.
+        dst_node
+            The destination node.
+        
+        Returns
+        -------
+        bool
+            Whether the graph contains an edge from :code:`src_node` to :code:`dst_node`.
+        """
+        return (src_node,dst_node) in self._edge_index
+    
+    def get_edges(self,src_node,dst_node):
+        """Returns the objects attached to the (parallel) edges from :code:`src_node` to 
+        :code:`dst_node`.
+        
+        Parameters
+        ----------
+        src_node
+            The source node.
+        dst_node
+            The destination node.
+        
+        Returns
+        -------
+        list
+            The edge objects, in the order in which the edges were added. The list is 
+            empty if there is no such edge.
+        """
+        edge_objs = self._edges.edge_obj.values
+        return [edge_objs[i] for i in self._edge_index.get((src_node,dst_node),[])]
+    
+    def remove_edges(self,edges):
+        """Removes all (parallel) edges between the given pairs of nodes. The nodes 
+        themselves are kept. Pairs which are not edges of the graph are ignored.
+        
+        Parameters
+        ----------
+        edges : iterable
+            An iterable which yields pairs of the form :code:`(src_node,dst_node)`.
+        """
+        for src,dst in edges:
+            self._tombstones.update(self._edge_index.pop((src,dst),[]))
+        self._maybe_compact()
+    
+    def remove_nodes(self,nodes):
+        """Removes nodes from the graph, together with all edges incident to them. 
+        Nodes which are not in the graph are ignored.
+        
+        Parameters
+        ----------
+        nodes : set-like
+            A collection of (distinct) hashable objects.
+        """
+        nodes = set(nodes)
+        self._nodes.difference_update(nodes)
+        mask = self._edges.src_node.isin(nodes) | self._edges.dst_node.isin(nodes)
+        for src,dst in zip(self._edges.src_node[mask],self._edges.dst_node[mask]):
+            self._edge_index.pop((src,dst),None)
+        self._tombstones.update(self._edges.index[mask])
+        self._maybe_compact()
+    
+    def compact(self):
+        """Drops the rows of removed edges from the underlying edge table. This is done
+        automatically once the fraction of removed rows exceeds 
+        :code:`compaction_threshold`.
+        """
+        if self._tombstones:
+            self._edges = self._live_edges().reset_index(drop = True)
+            self._tombstones = set()
+            self._rebuild_index()
+    
+    def _maybe_compact(self):
+        if len(self._tombstones) > self.compaction_threshold*len(self._edges):
+            self.compact()
+    
+    def _rebuild_index(self):
+        self._edge_index = dict()
+        for i,(src,dst) in enumerate(zip(self._edges.src_node,self._edges.dst_node)):
+            self._edge_index.setdefault((src,dst),[]).append(i)
+    
+    def _live_edges(self):
+        if not self._tombstones:
+            return self._edges
+        return self._edges.drop(list(self._tombstones))
+    
     def new_subgraph(self, edge_pred = None,node_pred = None):
         """Returns the maximal subgraph for which all nodes satisfy the node predicate
         and all edges satisfy the edge predicate.
@@ -119,12 +236,13 @@ class Graph():
         if edge_pred == None:
             edge_pred = lambda x,y,z: True
             
-        edge_mask = (self._edges.apply(lambda x: (edge_pred(x.src_node,x.dst_node,x.edge_obj)),
-                                       axis = 1)) \
-                    & (self._edges.src_node.apply(node_pred)) \
-                    & (self._edges.dst_node.apply(node_pred))
+        edges = self._live_edges()
+        edge_mask = (edges.apply(lambda x: (edge_pred(x.src_node,x.dst_node,x.edge_obj)),
+                                 axis = 1)) \
+                    & (edges.src_node.apply(node_pred)) \
+                    & (edges.dst_node.apply(node_pred))
                       
-        edges = self._edges[edge_mask]
+        edges = edges[edge_mask]
         new_graph = Graph().from_df(edges)
         new_graph.add_nodes({node for node in self._nodes if node_pred(node)})
         return new_graph
@@ -185,7 +303,7 @@ class Graph():
         # Attach addresses to the messages:
         addressed_msgs = itertools.chain.from_iterable(zip((e.src_node,e.dst_node),
                     emmiter(e.src_node,e.dst_node,e.edge_obj))
-                    for e in self._edges.itertuples())
+                    for e in self._live_edges().itertuples())
         
         # Aggregate the messages to each node
         agg_msgs = dict()
@@ -237,7 +355,7 @@ class Graph():
             |:code:`edge_obj`         |The object attached to the edge          |
             +-------------------------+-----------------------------------------+
         """
-        for e in self._edges.itertuples():
+        for e in self._live_edges().itertuples():
             updater(e.src_node,e.dst_node,e.edge_obj)
     
     def new_projection(self,edge_map,node_map):
@@ -294,9 +412,10 @@ class Graph():
         edge_map_variant = lambda x:edge_map(x.src_node,x.dst_node,x.edge_obj)
         for node in self._nodes:
             processed_nodes[node]=node_map(node)
-        new_edges = pd.DataFrame({'src_node':self._edges.src_node.apply(processed_nodes.get),
-                                  'dst_node':self._edges.dst_node.apply(processed_nodes.get),
-                                  'edge_obj':self._edges.apply(edge_map_variant,axis=1)}) 
+        edges = self._live_edges()
+        new_edges = pd.DataFrame({'src_node':edges.src_node.apply(processed_nodes.get),
+                                  'dst_node':edges.dst_node.apply(processed_nodes.get),
+                                  'edge_obj':edges.apply(edge_map_variant,axis=1)}) 
         new_graph = Graph().from_df(new_edges)
         new_graph.add_nodes(processed_nodes.values())
         return new_graph
@@ -383,17 +502,17 @@ class Graph():
             dst = '' if not b else b.group(0)[2:].strip()
             return src,dst,e
         
+        edges = self._live_edges()
         df_out = pd.DataFrame()
         for p in patterns:
             src,dst,e = parse_pattern(p)
-            mask = self._edges
             data = dict()
             if src != '':
-                data[src] = self._edges.src_node
+                data[src] = edges.src_node
             if dst != '':
-                data[dst] = self._edges.dst_node
+                data[dst] = edges.dst_node
             if e != '':
-                data[e] = self._edges.edge_obj
+                data[e] = edges.edge_obj
             df_tmp = pd.DataFrame(data)
             if df_out.size == 0:
                 df_out = df_tmp
@@ -410,7 +529,7 @@ class Graph():
             i += 1
         cur_repr += '\n\nEdges:\n'+'     Source Node'+' '*14+'Edge Object'+' '*14+'Destination Node'
         i = 1
-        for edge in self._edges.itertuples():
+        for edge in self._live_edges().itertuples():
             def truncate(txt,n):
                 if len(txt)>n:
                     return txt[:n-4]+' ... '
@@ -428,7 +547,7 @@ class Graph():
         with open(filename,'w') as file:
             file.write('digraph {\n')
             written_nodes = set()
-            for e in self._edges.itertuples():
+            for e in self._live_edges().itertuples():
                 src_txt = repr(e.src_node) if not node_repr else node_repr(e.src_node)
                 dst_txt = repr(e.dst_node) if not node_repr else node_repr(e.dst_node)
                 e_txt = repr(e.edge_obj) if not edge_repr else edge_repr(e.edge_obj)
@@ -444,7 +563,7 @@ class Graph():
         
     def save(self,filename):
         with open(filename,'wb') as file:
-            pickle.dump({'nodes':self._nodes,'edges':self._edges},file)
+            pickle.dump({'nodes':self._nodes,'edges':self._live_edges()},file)
     
     @staticmethod
     def load(filename):